@@ -84,20 +84,22 @@ CONFIG_SCHEMA = {
     }
 }
 
+CONFIG_VALIDATORS = {
+    'daemon_name': validation.daemon_name_validator,
+    'machine_name': validation.machine_name_validator,
+    'directory_path': validation.directory_path_validator,
+}
+
 
 class Config:
     """Daemon configuration parsed from a json file"""
     def __init__(self, config_filename):
         # Will throw on file not found or invalid json
-        with open(config_filename, 'r') as config_file:
-            config_json = json.load(config_file)
+        with open(config_filename, 'rb') as config_file:
+            config_json = json.loads(config_file.read())
 
         # Will throw on schema violations
-        validation.validate_config(config_json, CONFIG_SCHEMA, {
-            'daemon_name': validation.daemon_name_validator,
-            'machine_name': validation.machine_name_validator,
-            'directory_path': validation.directory_path_validator,
-        })
+        validation.validate_config(config_json, CONFIG_SCHEMA, CONFIG_VALIDATORS)
 
         self.daemon = getattr(daemons, config_json['daemon'])
         self.pipeline_daemon_name = config_json['pipeline_daemon']